@@ -1,128 +1,259 @@
+import heapq
+import os
 import random
-from collections import defaultdict, Counter
-from typing import List, Dict, Tuple
+import stat
+import sys
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Optional extra: the CP-SAT backend (schedule_with_cpsat) needs Google OR-Tools (pip install ortools).
+# Without it everything else works and main falls back to the built-in assignment solver.
+try:
+    from ortools.sat.python import cp_model
+except ImportError:
+    cp_model = None
 
 DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 SHIFTS = ["morning", "afternoon", "evening"]
+SHIFT_IDX = {s: i for i, s in enumerate(SHIFTS)}
+SHIFT_SET = frozenset(SHIFTS)
+# every accepted preference separator ('>', ',' or whitespace) becomes ',' in a single translate pass
+_SEPARATORS = str.maketrans({">": ",", " ": ",", "\t": ","})
+UNRANKED = 255  # marks "not among the preferences" in the byte tables below
+# _OPEN_DAYS[worked_mask] = bitmask of days an employee can still take, 0 once 5 days are worked.
+# Turns the "free that day and under 5 days" test into one table load and one bit test.
+_OPEN_DAYS = bytes(0 if bin(m).count("1") >= 5 else ~m & 0x7F for m in range(128))
+# Objective weights shared by the optimizing backends: staffing beats coverage beats preferences
+STAFF_BONUS = 10000  # per filled place up to the minimum staffing
+WORK_BONUS = 100  # per assigned shift
+NON_PREFERRED_COST = len(SHIFTS) + 1  # cost of a shift outside the preferences (ranked ones cost their rank)
+DAY_LOAD_COST = 1  # an employee's k-th working day (counting from 0) costs k * this, spreading days evenly
 
 class Employee:
     def __init__(self, name: str):
         self.name = name
         # preferences[day_index] = list of shifts in priority order, e.g. ["morning","evening"]
         self.preferences: Dict[int, List[str]] = {d: [] for d in range(7)}
-        self.days_assigned = 0
-        # assigned_shifts[day_index] = shift_name or None
-        self.assigned_shifts: Dict[int, str] = {}
 
     def __repr__(self):
-        return f"Employee({self.name}, assigned_days={self.days_assigned})"
+        return f"Employee({self.name})"
 
-def ask_user_input() -> Tuple[List[Employee], int]:
+@dataclass
+class Roster:
+    """
+    Struct-of-arrays view of the employees that the schedulers work on.
+    Employee e lives at index e of every array ((e * 7 + day) * 3 + k in the preference tables), so the
+    scheduling loops read flat byte arrays instead of per-object attributes and dicts.
+    """
+    names: List[str]
+    days_assigned: bytearray  # days_assigned[e] = number of days worked so far
+    worked: bytearray         # worked[e] = bitmask of assigned days, bit d set once day d has a shift
+    pref_rank: bytearray      # see build_preference_tables
+    pref_order: bytearray
+
+    @classmethod
+    def from_employees(cls, employees: List["Employee"]) -> "Roster":
+        n = len(employees)
+        pref_rank, pref_order = build_preference_tables(employees)
+        return cls(
+            names=[e.name for e in employees],
+            days_assigned=bytearray(n),
+            worked=bytearray(n),
+            pref_rank=pref_rank,
+            pref_order=pref_order,
+        )
+
+    def __len__(self):
+        return len(self.names)
+
+_file_answers: Optional[Iterator[str]] = None
+
+def _stdin_is_regular_file() -> bool:
+    try:
+        return stat.S_ISREG(os.fstat(sys.stdin.fileno()).st_mode)
+    except (AttributeError, OSError, ValueError):  # no real file descriptor behind stdin
+        return False
+
+def ask(prompt: str) -> str:
+    """
+    input() replacement. When stdin is redirected from a regular file (python EmployeeShifts.py < answers.txt)
+    the whole file is read once on first use and answers are served from memory. Terminals and pipes keep
+    using input(), so the prompt always shows before we wait for an answer (pipes may be interactive consoles).
+    Running out of redirected or piped answers gives "" (the default).
+    """
+    global _file_answers
+    if _file_answers is None and _stdin_is_regular_file():
+        _file_answers = iter(sys.stdin.read().splitlines())
+    if _file_answers is not None:
+        sys.stdout.write(prompt)
+        return next(_file_answers, "")
+    try:
+        return input(prompt)
+    except EOFError:
+        if sys.stdin.isatty():
+            raise
+        return ""
+
+def ask_user_input(seed: Optional[int] = None) -> Tuple[List[Employee], int]:
     """
     Interactive input helper. User can choose to enter employees manually or use sample data.
+    seed makes the random sample preferences reproducible.
     Returns (employees_list, max_per_shift)
     """
     print("Employee Shift Scheduler — Input")
-    use_sample = input("Use sample data? (y/n) [n]: ").strip().lower() or "n"
+    use_sample = ask("Use sample data? (y/n) [n]: ").strip().lower() or "n"
     employees = []
     if use_sample == "y":
         # Create sample employees with random preferences
         sample_names = ["Alice", "Bob", "Charlie", "Deepa", "Ethan", "Farah", "Gopal", "Hina", "Irfan"]
         employees = [Employee(n) for n in sample_names]
+        rng = random.Random(seed)
         for e in employees:
             for d in range(7):
-                # create a random ranking of SHIFTS
-                prefs = SHIFTS[:] 
-                random.shuffle(prefs)
-                # keep full ranking (bonus)
-                e.preferences[d] = prefs
+                # create a random ranking of SHIFTS, keep full ranking (bonus)
+                e.preferences[d] = rng.sample(SHIFTS, len(SHIFTS))
         print(f"Created {len(employees)} sample employees.")
     else:
-        n = int(input("How many employees? Enter integer: ").strip())
+        n = int(ask("How many employees? Enter integer: ").strip())
         for i in range(n):
-            name = input(f"Name of employee #{i+1}: ").strip() or f"Emp{i+1}"
+            name = ask(f"Name of employee #{i+1}: ").strip() or f"Emp{i+1}"
             emp = Employee(name)
             print(f"Now enter preferences for {name}. For each day provide ranked shifts separated by '>' (e.g. morning>evening) or comma.")
             print("Use any subset of ['morning','afternoon','evening']. If empty, we treat as 'no preference'.")
             for d_idx, day in enumerate(DAYS):
-                raw = input(f"  {day} preferences: ").strip()
+                raw = ask(f"  {day} preferences: ").strip()
                 if not raw:
                     emp.preferences[d_idx] = []
                 else:
                     # normalize input: separators '>' or ',' or whitespace
-                    parts = [p.strip().lower() for p in raw.replace(">", ",").split(",") if p.strip()]
+                    parts = [p.lower() for p in raw.translate(_SEPARATORS).split(",") if p]
                     # filter invalid names and keep order
-                    emp.preferences[d_idx] = [p for p in parts if p in SHIFTS]
+                    emp.preferences[d_idx] = [p for p in parts if p in SHIFT_SET]
             employees.append(emp)
     # max per shift
-    max_per_shift_str = input("Enter maximum employees allowed per shift (per day). Default 5: ").strip()
+    max_per_shift_str = ask("Enter maximum employees allowed per shift (per day). Default 5: ").strip()
     max_per_shift = int(max_per_shift_str) if max_per_shift_str.isdigit() else 5
     return employees, max_per_shift
 
-def initialize_schedule():
-    # schedule[day_idx][shift] = list of employee names assigned
-    schedule = [ {s: [] for s in SHIFTS} for _ in range(7) ]
-    return schedule
+def build_preference_tables(employees: List[Employee]) -> Tuple[bytearray, bytearray]:
+    """
+    Flatten every employee's preferences into two dense byte tables indexed by (e * 7 + day) * 3 + k:
+      pref_rank[... + shift_idx] = rank of that shift (0 = top choice) or UNRANKED
+      pref_order[... + rank]     = shift index holding that rank, UNRANKED once the ranking runs out
+    Built once per scheduling run so the hot loops never touch the per-employee dicts or compare strings.
+    """
+    per_day = len(SHIFTS)
+    pref_rank = bytearray([UNRANKED]) * (len(employees) * 7 * per_day)
+    pref_order = bytearray(pref_rank)
+    for e, emp in enumerate(employees):
+        for day in range(7):
+            base = (e * 7 + day) * per_day
+            rank = 0
+            for shift in emp.preferences.get(day, []) or []:
+                s_idx = SHIFT_IDX[shift]
+                if pref_rank[base + s_idx] != UNRANKED:
+                    continue  # repeated entry, keep its best rank
+                pref_rank[base + s_idx] = rank
+                pref_order[base + rank] = s_idx
+                rank += 1
+    return pref_rank, pref_order
 
-def can_assign(emp: Employee, day: int) -> bool:
-    """Check if employee can be assigned on given day (not already assigned that day and under 5 days)."""
-    if day in emp.assigned_shifts:
-        return False
-    if emp.days_assigned >= 5:
-        return False
-    return True
+@dataclass
+class Schedule:
+    """
+    The week as one preallocated slot array instead of per-shift name lists.
+    Shift s on day d owns slots[(d * 3 + s) * slots_per_shift:][:slots_per_shift], filled front to back with
+    employee indices (-1 = empty); counts[d * 3 + s] is how many of them are taken.
+    slots_per_shift is max_per_shift capped at the roster size, since a shift can't hold more people than exist.
+    Names are only looked up (see shift_names) when the schedule is printed.
+    """
+    slots_per_shift: int
+    slots: array
+    counts: List[int]
+
+    def shift_names(self, roster: Roster, day: int, s_idx: int) -> List[str]:
+        i = day * 3 + s_idx
+        start = i * self.slots_per_shift
+        names = roster.names
+        return [names[e] for e in self.slots[start: start + self.counts[i]]]
 
-def assign_employee_to_shift(emp: Employee, day: int, shift: str, schedule: List[Dict[str,List[str]]]):
-    schedule[day][shift].append(emp.name)
-    emp.assigned_shifts[day] = shift
-    emp.days_assigned += 1
+def initialize_schedule(max_per_shift: int, n_employees: int) -> Schedule:
+    # capacity checks keep using the real max_per_shift; this only bounds the storage
+    slots_per_shift = max(0, min(max_per_shift, n_employees))
+    return Schedule(
+        slots_per_shift=slots_per_shift,
+        slots=array("i", [-1]) * (7 * len(SHIFTS) * slots_per_shift),
+        counts=[0] * (7 * len(SHIFTS)),
+    )
 
-def schedule_with_preferences(employees: List[Employee], max_per_shift: int):
-    schedule = initialize_schedule()
+def eligible_employees(roster: Roster, day: int) -> List[int]:
+    """Indices of every employee that can still be assigned on the given day (free that day and under 5 days)."""
+    bit = 1 << day
+    return [e for e, mask in enumerate(roster.worked) if _OPEN_DAYS[mask] & bit]
 
-    # Randomize employee order per day for fairness
-    emp_order = employees[:]
-    random.shuffle(emp_order)
+def assign_employee_to_shift(roster: Roster, e: int, day: int, s_idx: int, schedule: Schedule):
+    i = day * 3 + s_idx
+    filled = schedule.counts[i]
+    schedule.slots[i * schedule.slots_per_shift + filled] = e
+    schedule.counts[i] = filled + 1
+    roster.worked[e] |= 1 << day
+    roster.days_assigned[e] += 1
+
+def place_on_best_shift(roster: Roster, e: int, day: int, schedule: Schedule, max_per_shift: int) -> bool:
+    """
+    Inner kernel shared by the greedy passes: put employee e on their best-ranked shift that still has room
+    on that day, otherwise on any shift with room. Returns False if every shift that day is full.
+    """
+    row = day * 3
+    base = (e * 7 + day) * 3
+    pref_order = roster.pref_order
+    counts = schedule.counts
+    # try each preference in ranked order
+    for rank in range(3):
+        s_idx = pref_order[base + rank]
+        if s_idx == UNRANKED:
+            break
+        if counts[row + s_idx] < max_per_shift:
+            assign_employee_to_shift(roster, e, day, s_idx, schedule)
+            return True
+    # preferred ones are full (or there are none): any shift with room will do
+    for s_idx in range(3):
+        if counts[row + s_idx] < max_per_shift:
+            assign_employee_to_shift(roster, e, day, s_idx, schedule)
+            return True
+    return False
+
+def schedule_with_preferences(roster: Roster, max_per_shift: int, seed: Optional[int] = None):
+    schedule = initialize_schedule(max_per_shift, len(roster))
+
+    # Randomize employee order per day for fairness: draw all seven day orders up front
+    # from a private generator, so a seed reproduces the schedule without touching the global one
+    n = len(roster)
+    rng = random.Random(seed)
+    employee_ids = range(n)
+    day_orders = [rng.sample(employee_ids, n) for _ in range(7)]
 
     # First pass: try to assign employees to their top available preference for each day
-    for day in range(7):
-        random.shuffle(emp_order)
-        for emp in emp_order:
-            if not can_assign(emp, day):
+    worked = roster.worked
+    for day, emp_order in enumerate(day_orders):
+        bit = 1 << day
+        for e in emp_order:
+            if not _OPEN_DAYS[worked[e]] & bit:
                 continue
-            prefs = emp.preferences.get(day, []) or []
-            assigned = False
-            # try each preference in ranked order
-            for shift in prefs:
-                if len(schedule[day][shift]) < max_per_shift:
-                    assign_employee_to_shift(emp, day, shift, schedule)
-                    assigned = True
-                    break
-            # if no preferences or preferred full, we'll try in conflict resolution later (or now try other shifts same day)
-            if not assigned:
-                # attempt other shifts on same day (non-preferred) as early conflict resolution
-                for shift in SHIFTS:
-                    if shift in prefs:
-                        continue
-                    if len(schedule[day][shift]) < max_per_shift:
-                        assign_employee_to_shift(emp, day, shift, schedule)
-                        assigned = True
-                        break
-            # if still not assigned, leave unassigned for now (maybe next-day resolution)
-    # After first pass, ensure min staffing per shift per day
-    shortages = ensure_minimum_staffing(schedule, employees, min_required=2, max_per_shift=max_per_shift)
-
-    # For employees still with free capacity (under 5 days), try to fill any remaining unassigned employees who are not assigned any shift on certain days
-    # Also try to resolve any unfilled shift shortages by looking ahead next days if possible.
-    if shortages:
-        resolve_shortages_via_next_day(schedule, employees, shortages, max_per_shift)
+            # preferred shifts first, other shifts of the same day as early conflict resolution;
+            # if every shift is full, leave them unassigned for the day
+            place_on_best_shift(roster, e, day, schedule, max_per_shift)
+    # After first pass, ensure min staffing per shift per day. Whatever is still short has no eligible
+    # employee left that day; summary_stats reports it (schedule_with_assignment solves it globally).
+    ensure_minimum_staffing(schedule, roster, min_required=2, max_per_shift=max_per_shift)
 
     # Final check: try to assign unassigned employees (who still can work days) to any shift minimally to maximize coverage
-    fill_remaining_with_available(schedule, employees, max_per_shift)
+    fill_remaining_with_available(schedule, roster, max_per_shift)
 
     return schedule
 
-def ensure_minimum_staffing(schedule: List[Dict[str,List[str]]], employees: List[Employee], min_required: int, max_per_shift: int):
+def ensure_minimum_staffing(schedule: Schedule, roster: Roster, min_required: int, max_per_shift: int):
     """
     For each day & shift ensure at least min_required employees assigned.
     If not enough prefer that shift, randomly pick eligible employees who:
@@ -132,113 +263,240 @@ def ensure_minimum_staffing(schedule: List[Dict[str,List[str]]], employees: List
     Returns a list of shortages as tuples (day, shift, missing_count).
     """
     shortages = []
-    # Build a name->employee map
-    emp_map = {e.name: e for e in employees}
+    counts = schedule.counts
+    load = roster.days_assigned.__getitem__
     for day in range(7):
-        for shift in SHIFTS:
-            need = min_required - len(schedule[day][shift])
-            if need > 0:
-                # choose eligible employees
-                eligible = [e for e in employees if can_assign(e, day)]
-                # sort eligible by fewest days_assigned to spread load
-                eligible.sort(key=lambda x: x.days_assigned)
-                chosen = []
-                for e in eligible:
-                    if len(chosen) >= need:
-                        break
-                    # ensure we don't exceed max_per_shift
-                    if len(schedule[day][shift]) + len(chosen) < max_per_shift:
-                        chosen.append(e)
-                for e in chosen:
-                    assign_employee_to_shift(e, day, shift, schedule)
-                short_remaining = need - len(chosen)
-                if short_remaining > 0:
-                    shortages.append((day, shift, short_remaining))
+        row = day * 3
+        # (shift index, missing, how many fit under max_per_shift) for every short shift of the day
+        short = []
+        for s_idx in range(3):
+            filled = counts[row + s_idx]
+            if filled < min_required:
+                short.append((s_idx, min_required - filled, max(0, min(min_required, max_per_shift) - filled)))
+        if not short:
+            continue
+        # eligibility only depends on the day: one scan and one least-loaded selection cover all
+        # short shifts, which then take consecutive runs of candidates
+        candidates = heapq.nsmallest(sum(take for _, _, take in short), eligible_employees(roster, day), key=load)
+        pos = 0
+        for s_idx, need, take in short:
+            chosen = candidates[pos: pos + take]
+            pos += len(chosen)
+            for e in chosen:
+                assign_employee_to_shift(roster, e, day, s_idx, schedule)
+            short_remaining = need - len(chosen)
+            if short_remaining > 0:
+                shortages.append((day, SHIFTS[s_idx], short_remaining))
     return shortages
 
-def resolve_shortages_via_next_day(schedule: List[Dict[str,List[str]]], employees: List[Employee], shortages: List[Tuple[int,str,int]], max_per_shift:int):
-    """
-    Try to resolve shortages by moving employees from other days (who have flexible preferences)
-    or assigning employees to adjacent days/shifts if they have capacity.
-    This is a heuristic: we try to find employees who are free on the shortage day and have capacity.
-    """
-    if not shortages:
-        return []
-    emp_map = {e.name: e for e in employees}
-    updated_shortages = []
-    for day, shift, need in shortages:
-        chosen = []
-        eligible = [e for e in employees if can_assign(e, day)]
-        eligible.sort(key=lambda x: x.days_assigned)
-        for e in eligible:
-            if len(chosen) >= need:
-                break
-            if len(schedule[day][shift]) + len(chosen) < max_per_shift:
-                assign_employee_to_shift(e, day, shift, schedule)
-                chosen.append(e)
-        still = need - len(chosen)
-        if still > 0:
-            # try next days: assign someone to next day but we need staffing for this specific day,
-            # so next-day assignment doesn't fix today's shortage. We'll mark as unresolved.
-            updated_shortages.append((day, shift, still))
-    return updated_shortages
-
-def fill_remaining_with_available(schedule: List[Dict[str,List[str]]], employees: List[Employee], max_per_shift: int):
+def fill_remaining_with_available(schedule: Schedule, roster: Roster, max_per_shift: int):
     """
     Final pass: assign any employees who still have capacity to days where they were unassigned and shift has space.
     Tries to respect their preferences first.
     """
-    emp_map = {e.name: e for e in employees}
+    n = len(roster)
+    counts = schedule.counts
+    # stop as soon as the schedule is saturated: everyone at 5 days or every shift at max_per_shift
+    total_assigned = sum(roster.days_assigned)
+    if total_assigned >= 5 * n or all(c >= max_per_shift for c in counts):
+        return
     # For each day, for each employee unassigned that day and with capacity, try to assign to a space
     for day in range(7):
-        for emp in employees:
-            if not can_assign(emp, day):
-                continue
-            prefs = emp.preferences[day]
-            assigned = False
-            # try preferences first
-            for shift in prefs:
-                if len(schedule[day][shift]) < max_per_shift:
-                    assign_employee_to_shift(emp, day, shift, schedule)
-                    assigned = True
-                    break
-            if assigned:
-                continue
-            # try any shift
-            for shift in SHIFTS:
-                if len(schedule[day][shift]) < max_per_shift:
-                    assign_employee_to_shift(emp, day, shift, schedule)
-                    break
-
-def pretty_print_schedule(schedule: List[Dict[str,List[str]]]):
-    print("\nFinal Schedule for the Week:\n")
+        if min(counts[day * 3: day * 3 + 3]) >= max_per_shift:
+            continue
+        # assigning someone only changes their own eligibility, so the day's list stays valid throughout
+        for e in eligible_employees(roster, day):
+            if not place_on_best_shift(roster, e, day, schedule, max_per_shift):
+                break  # all three shifts of this day are full
+            total_assigned += 1
+            if total_assigned >= 5 * n:
+                return
+
+def _min_cost_flow(n_nodes: int, arcs: List[Tuple[int,int,int,int]], source: int, sink: int) -> List[int]:
+    """
+    Successive shortest paths (Bellman-Ford/SPFA on the residual graph).
+    arcs = [(u, v, capacity, cost)]. Keeps pushing flow while the cheapest augmenting path has negative cost,
+    so the result is a minimum-cost flow of any size. Returns the flow on each arc, in the order given.
+    """
+    to, cap, cost = [], [], []
+    graph: List[List[int]] = [[] for _ in range(n_nodes)]
+    for u, v, c, w in arcs:
+        # forward arc at even index, residual arc right after it
+        graph[u].append(len(to)); to.append(v); cap.append(c); cost.append(w)
+        graph[v].append(len(to)); to.append(u); cap.append(0); cost.append(-w)
+    inf = float("inf")
+    while True:
+        dist = [inf] * n_nodes
+        prev_arc = [-1] * n_nodes
+        in_queue = [False] * n_nodes
+        dist[source] = 0
+        queue = [source]
+        head = 0
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+            in_queue[u] = False
+            du = dist[u]
+            for a in graph[u]:
+                if cap[a] > 0:
+                    v = to[a]
+                    nd = du + cost[a]
+                    if nd < dist[v]:
+                        dist[v] = nd
+                        prev_arc[v] = a
+                        if not in_queue[v]:
+                            in_queue[v] = True
+                            queue.append(v)
+        if dist[sink] >= 0:
+            break
+        # find bottleneck along the path, then augment
+        push = inf
+        v = sink
+        while v != source:
+            a = prev_arc[v]
+            push = min(push, cap[a])
+            v = to[a ^ 1]
+        v = sink
+        while v != source:
+            a = prev_arc[v]
+            cap[a] -= push
+            cap[a ^ 1] += push
+            v = to[a ^ 1]
+    return [cap[2 * i + 1] for i in range(len(arcs))]
+
+def schedule_with_assignment(roster: Roster, max_per_shift: int, min_required: int = 2):
+    """
+    Solve the whole week at once as a min-cost flow instead of the multi-pass greedy:
+      source -> employee (5 unit arcs, cost grows with load so days are spread evenly)
+             -> employee-day (capacity 1, so at most one shift per day)
+             -> day-shift (cost = preference rank, non-preferred shifts cost more)
+             -> sink (first min_required places carry a large bonus, the rest a smaller coverage bonus)
+    Priorities are: minimum staffing first, then total coverage, then preferences and fairness.
+    """
+    schedule = initialize_schedule(max_per_shift, len(roster))
+    if max_per_shift <= 0:
+        return schedule
+    n = len(roster)
+    source, sink = 0, 1
+    emp_node = 2
+    emp_day_node = emp_node + n
+    day_shift_node = emp_day_node + 7 * n
+    n_nodes = day_shift_node + 7 * len(SHIFTS)
+
+    pref_rank = roster.pref_rank
+    arcs: List[Tuple[int,int,int,int]] = []
+    choice_arcs: List[Tuple[int,int,int,int]] = []  # (arc index, employee, day, shift index)
+    for e in range(n):
+        for load in range(5):
+            arcs.append((source, emp_node + e, 1, load * DAY_LOAD_COST))
+        for day in range(7):
+            ed = emp_day_node + e * 7 + day
+            arcs.append((emp_node + e, ed, 1, 0))
+            base = (e * 7 + day) * len(SHIFTS)
+            for s_idx in range(len(SHIFTS)):
+                rank = pref_rank[base + s_idx]
+                if rank == UNRANKED:
+                    rank = NON_PREFERRED_COST
+                choice_arcs.append((len(arcs), e, day, s_idx))
+                arcs.append((ed, day_shift_node + day * len(SHIFTS) + s_idx, 1, rank))
+    required = min(min_required, max_per_shift)
+    for ds in range(7 * len(SHIFTS)):
+        arcs.append((day_shift_node + ds, sink, required, -STAFF_BONUS - WORK_BONUS))
+        if max_per_shift > required:
+            arcs.append((day_shift_node + ds, sink, max_per_shift - required, -WORK_BONUS))
+
+    flow = _min_cost_flow(n_nodes, arcs, source, sink)
+    for a, e, day, s_idx in choice_arcs:
+        if flow[a]:
+            assign_employee_to_shift(roster, e, day, s_idx, schedule)
+    return schedule
+
+def schedule_with_cpsat(roster: Roster, max_per_shift: int, min_required: int = 2, time_limit: float = 10.0):
+    """
+    Same objective as schedule_with_assignment, stated as a CP-SAT model (needs the optional ortools package):
+      work[e,d,s] in {0,1}, at most one shift per employee-day, at most 5 days per employee,
+      at most max_per_shift per shift, a penalized shortage variable for each shift below min_required,
+      and the flow model's growing per-day load cost, looked up from each employee's day count.
+    Raises RuntimeError if ortools is missing or the solver finds no solution within time_limit seconds.
+    """
+    if cp_model is None:
+        raise RuntimeError("CP-SAT backend needs ortools (pip install ortools)")
+    schedule = initialize_schedule(max_per_shift, len(roster))
+    n = len(roster)
+    per_day = len(SHIFTS)
+    pref_rank = roster.pref_rank
+    required = max(0, min(min_required, max_per_shift))
+
+    model = cp_model.CpModel()
+    work = [model.NewBoolVar(f"work_{e}_{i}") for e in range(n) for i in range(7 * per_day)]  # work[(e * 7 + day) * 3 + s]
+    objective = []
+    # total load cost of working k days = sum of the flow model's per-day costs 0..k-1
+    load_costs = [DAY_LOAD_COST * k * (k - 1) // 2 for k in range(6)]
+    for e in range(n):
+        row = e * 7 * per_day
+        for day in range(7):
+            model.AddAtMostOne(work[row + day * per_day: row + (day + 1) * per_day])
+        days = model.NewIntVar(0, 5, f"days_{e}")
+        model.Add(days == sum(work[row: row + 7 * per_day]))
+        load = model.NewIntVar(0, load_costs[-1], f"load_{e}")
+        model.AddElement(days, load_costs, load)
+        objective.append(-load)
+        for i in range(7 * per_day):
+            rank = pref_rank[row + i]
+            objective.append((WORK_BONUS - (NON_PREFERRED_COST if rank == UNRANKED else rank)) * work[row + i])
+    for i in range(7 * per_day):
+        staffed = sum(work[e * 7 * per_day + i] for e in range(n))
+        model.Add(staffed <= max_per_shift)
+        shortage = model.NewIntVar(0, required, f"short_{i}")
+        model.Add(staffed + shortage >= required)
+        objective.append(-STAFF_BONUS * shortage)
+    model.Maximize(sum(objective))
+
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = time_limit
+    status = solver.Solve(model)
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        raise RuntimeError(f"CP-SAT found no schedule ({solver.StatusName(status)})")
+    for e in range(n):
+        for day in range(7):
+            base = (e * 7 + day) * per_day
+            for s_idx in range(per_day):
+                if solver.BooleanValue(work[base + s_idx]):
+                    assign_employee_to_shift(roster, e, day, s_idx, schedule)
+    return schedule
+
+def format_schedule_lines(schedule: Schedule, roster: Roster, day_separator: str) -> List[str]:
+    """One line per day header and per shift, with day_separator after each day."""
+    lines = []
     for d_idx, day in enumerate(DAYS):
-        print(f"{day}:")
-        for shift in SHIFTS:
-            names = schedule[d_idx][shift]
-            print(f"  {shift.title():9}: {', '.join(names) if names else '(none)'}")
-        print("-" * 40)
-
-def summary_stats(schedule: List[Dict[str,List[str]]], employees: List[Employee]):
-    # Count total assignments per employee and report anyone who exceeded constraints (shouldn't happen)
-    counts = Counter()
-    for d in range(7):
-        for s in SHIFTS:
-            for name in schedule[d][s]:
-                counts[name] += 1
+        lines.append(f"{day}:")
+        for s_idx, shift in enumerate(SHIFTS):
+            names = schedule.shift_names(roster, d_idx, s_idx)
+            lines.append(f"  {shift.title():9}: {', '.join(names) if names else '(none)'}")
+        lines.append(day_separator)
+    return lines
+
+def pretty_print_schedule(schedule: Schedule, roster: Roster):
+    # build the whole table and write it once instead of one print per line
+    lines = ["\nFinal Schedule for the Week:\n"] + format_schedule_lines(schedule, roster, "-" * 40)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def summary_stats(schedule: Schedule, roster: Roster):
+    # Report total assignments per employee (tracked by the roster) and anyone who exceeded constraints (shouldn't happen)
     print("\nEmployee assignment summary (days assigned):")
-    for e in employees:
-        print(f" - {e.name:12}: {e.days_assigned} day(s)")
+    for name, days in zip(roster.names, roster.days_assigned):
+        print(f" - {name:12}: {days} day(s)")
     # Check for issues
     issues = []
-    for e in employees:
-        if e.days_assigned > 5:
-            issues.append(f"{e.name} assigned > 5 days ({e.days_assigned})")
+    for name, days in zip(roster.names, roster.days_assigned):
+        if days > 5:
+            issues.append(f"{name} assigned > 5 days ({days})")
     # Check shifts for min staffing
     for d in range(7):
-        for s in SHIFTS:
-            if len(schedule[d][s]) < 2:
-                issues.append(f"{DAYS[d]} {s} has fewer than 2 staff ({len(schedule[d][s])})")
+        for s_idx, s in enumerate(SHIFTS):
+            staffed = schedule.counts[d * 3 + s_idx]
+            if staffed < 2:
+                issues.append(f"{DAYS[d]} {s} has fewer than 2 staff ({staffed})")
     if issues:
         print("\nWarnings / Issues detected:")
         for it in issues:
@@ -247,24 +505,40 @@ def summary_stats(schedule: List[Dict[str,List[str]]], employees: List[Employee]
         print("\nNo issues detected. All constraints satisfied (or warnings handled).")
 
 def main():
-    employees, max_per_shift = ask_user_input()
+    # optional seed on the command line (python EmployeeShifts.py 42) makes sample data and greedy order reproducible
+    seed = None
+    if len(sys.argv) > 1:
+        try:
+            seed = int(sys.argv[1])
+        except ValueError:
+            print(f"usage: {sys.argv[0]} [seed]  (seed must be an integer, got {sys.argv[1]!r})")
+            sys.exit(2)
+    employees, max_per_shift = ask_user_input(seed)
     if not employees:
         print("No employees provided. Exiting.")
         return
-    print("\nScheduling... (this may reshuffle employees for fairness)")
-    schedule = schedule_with_preferences(employees, max_per_shift)
-    pretty_print_schedule(schedule)
-    summary_stats(schedule, employees)
+    roster = Roster.from_employees(employees)
+    method = ask("Scheduling method: (o)ptimal assignment, (c)p-sat solver (needs ortools) or (g)reedy heuristic? [o]: ").strip().lower() or "o"
+    schedule = None
+    if method == "g":
+        print("\nScheduling... (this may reshuffle employees for fairness)")
+        schedule = schedule_with_preferences(roster, max_per_shift, seed=seed)
+    elif method == "c":
+        print("\nScheduling... (CP-SAT solver)")
+        try:
+            schedule = schedule_with_cpsat(roster, max_per_shift)
+        except RuntimeError as exc:
+            print(f"{exc}. Falling back to the optimal assignment.")
+    if schedule is None:
+        print("\nScheduling... (solving the whole week as one assignment problem)")
+        schedule = schedule_with_assignment(roster, max_per_shift)
+    pretty_print_schedule(schedule, roster)
+    summary_stats(schedule, roster)
     # Optionally export to file
-    save = input("\nWould you like to save this schedule to 'schedule_week.txt'? (y/n) [n]: ").strip().lower() or "n"
+    save = ask("\nWould you like to save this schedule to 'schedule_week.txt'? (y/n) [n]: ").strip().lower() or "n"
     if save == "y":
         with open("schedule_week.txt", "w") as f:
-            for d_idx, day in enumerate(DAYS):
-                f.write(f"{day}:\n")
-                for shift in SHIFTS:
-                    names = schedule[d_idx][shift]
-                    f.write(f"  {shift.title():9}: {', '.join(names) if names else '(none)'}\n")
-                f.write("\n")
+            f.write("\n".join(format_schedule_lines(schedule, roster, "")) + "\n")
         print("Saved to schedule_week.txt")
 
 if __name__ == "__main__":